@@ -3,12 +3,20 @@ Interactive agent launcher script.
 Allows users to select an agent from available options and launch it using uv.
 """
 
+import hashlib
+import importlib.metadata
+import json
 import os
-import shlex
+import re
+import select
+import shutil
+import signal
 import subprocess
-from datetime import datetime
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence
 
 # Mapping from agent name to analyst key (for ai-hedge-fund agents)
 MAP_NAME_ANALYST: Dict[str, str] = {
@@ -38,62 +46,130 @@ NEWS_AGENT_NAME = "NewsAgent"
 #     RESEARCH_AGENT_NAME,
 #     AUTO_TRADING_AGENT_NAME,
 # ]
-AGENTS = [RESEARCH_AGENT_NAME, AUTO_TRADING_AGENT_NAME, NEWS_AGENT_NAME]
+# Ordered tuple for deterministic iteration
+AGENTS = (RESEARCH_AGENT_NAME, AUTO_TRADING_AGENT_NAME, NEWS_AGENT_NAME)
 
-PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+# abspath avoids realpath's per-component lstat walk; opt back into symlink
+# resolution with VALUECELL_RESOLVE_SYMLINKS=1
+if os.getenv("VALUECELL_RESOLVE_SYMLINKS") == "1":
+    _SCRIPT_PATH = os.path.realpath(__file__)
+else:
+    _SCRIPT_PATH = os.path.abspath(__file__)
+PROJECT_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(_SCRIPT_PATH))))
 PYTHON_DIR = PROJECT_DIR / "python"
 ENV_PATH = PROJECT_DIR / ".env"
+CONFIGS_DIR = PYTHON_DIR / "configs"
+VALIDATION_CACHE_PATH = Path.home() / ".cache" / "valuecell" / "validation.json"
+# Validator sources; editing them can change verdicts without touching configs
+VALIDATION_SOURCE_PATHS = (
+    PYTHON_DIR / "valuecell" / "utils" / "config_validator.py",
+    PYTHON_DIR / "valuecell" / "config" / "manager.py",
+    PYTHON_DIR / "valuecell" / "config" / "loader.py",
+)
+# Environment variables the config loader and manager read directly; the
+# rest are named by the config files (see collect_config_env_vars)
+CONFIG_MANAGER_ENV_VARS = (
+    "APP_ENVIRONMENT",
+    "PRIMARY_PROVIDER",
+    "AUTO_DETECT_PROVIDER",
+    "FALLBACK_PROVIDERS",
+)
+# ${VAR} / ${VAR:default} references resolved by the config loader
+ENV_REFERENCE_PATTERN = re.compile(r"\$\{([^}:]+)")
 
 # Convert paths to POSIX format (forward slashes) for cross-platform compatibility
 # as_posix() works on both Windows and Unix systems
-# Keep unquoted versions for Python path operations and quoted versions for shell commands
 PROJECT_DIR_STR = PROJECT_DIR.as_posix()
 PYTHON_DIR_STR = PYTHON_DIR.as_posix()
 ENV_PATH_STR = ENV_PATH.as_posix()
 
-# Create properly quoted versions for shell commands using shlex.quote()
-PROJECT_DIR_QUOTED = shlex.quote(PROJECT_DIR_STR)
-PYTHON_DIR_QUOTED = shlex.quote(PYTHON_DIR_STR)
-ENV_PATH_QUOTED = shlex.quote(ENV_PATH_STR)
+# Resolve uv once so Popen receives an absolute executable path and does not
+# search PATH on every launch
+UV_BIN = shutil.which("uv") or "uv"
+
 
-AUTO_TRADING_ENV_OVERRIDES = {
-    "AUTO_TRADING_EXCHANGE": os.getenv("AUTO_TRADING_EXCHANGE"),
+def uv_run_command(directory: str, *args: str) -> List[str]:
+    """Build a `uv run` argv that executes inside the given directory"""
+    return [UV_BIN, "run", "--directory", directory, "--env-file", ENV_PATH_STR, *args]
+
+
+# Mapping from agent name to module for agents living in this package
+MAP_NAME_MODULE: Dict[str, str] = {
+    RESEARCH_AGENT_NAME: "valuecell.agents.research_agent",
+    AUTO_TRADING_AGENT_NAME: "valuecell.agents.auto_trading_agent",
+    NEWS_AGENT_NAME: "valuecell.agents.news_agent",
 }
-AUTO_TRADING_ENV_PREFIX = " ".join(
-    f"{key}={value}"
-    for key, value in AUTO_TRADING_ENV_OVERRIDES.items()
-    if value not in (None, "")
-)
-if AUTO_TRADING_ENV_PREFIX:
-    AUTO_TRADING_ENV_PREFIX = f"{AUTO_TRADING_ENV_PREFIX} "
-
-# Mapping from agent name to launch command
-# Use quoted versions for shell commands and relative paths for .env to avoid issues with spaces
-MAP_NAME_COMMAND: Dict[str, str] = {}
-for name, analyst in MAP_NAME_ANALYST.items():
-    MAP_NAME_COMMAND[name] = (
-        f'cd {PYTHON_DIR_QUOTED}/third_party/ai-hedge-fund && uv run --env-file ../../../.env -m adapter --analyst {analyst}'
-    )
-MAP_NAME_COMMAND[TRADING_AGENTS_NAME] = (
-    f'cd {PYTHON_DIR_QUOTED}/third_party/TradingAgents && uv run --env-file ../../../.env -m adapter'
-)
-MAP_NAME_COMMAND[RESEARCH_AGENT_NAME] = (
-    f'cd {PYTHON_DIR_QUOTED} && uv run --env-file ../.env -m valuecell.agents.research_agent'
-)
-MAP_NAME_COMMAND[AUTO_TRADING_AGENT_NAME] = (
-    f'{AUTO_TRADING_ENV_PREFIX}cd {PYTHON_DIR_QUOTED} && uv run --env-file ../.env -m valuecell.agents.auto_trading_agent'
-)
-MAP_NAME_COMMAND[NEWS_AGENT_NAME] = (
-    f'cd {PYTHON_DIR_QUOTED} && uv run --env-file ../.env -m valuecell.agents.news_agent'
-)
-BACKEND_COMMAND = (
-    f'cd {PYTHON_DIR_QUOTED} && uv run --env-file ../.env -m valuecell.server.main'
+
+# Mapping from agent name to its config name (configs/agents/<name>.yaml)
+MAP_NAME_CONFIG: Dict[str, str] = {
+    RESEARCH_AGENT_NAME: "research_agent",
+    AUTO_TRADING_AGENT_NAME: "auto_trading_agent",
+    NEWS_AGENT_NAME: "news_agent",
+}
+
+
+def build_agent_command(agent_name: str) -> List[str]:
+    """Build the launch argv for a single agent"""
+    if agent_name in MAP_NAME_ANALYST:
+        return uv_run_command(
+            f"{PYTHON_DIR_STR}/third_party/ai-hedge-fund",
+            "-m",
+            "adapter",
+            "--analyst",
+            MAP_NAME_ANALYST[agent_name],
+        )
+    if agent_name == TRADING_AGENTS_NAME:
+        return uv_run_command(
+            f"{PYTHON_DIR_STR}/third_party/TradingAgents", "-m", "adapter"
+        )
+    return uv_run_command(PYTHON_DIR_STR, "-m", MAP_NAME_MODULE[agent_name])
+
+
+def get_auto_trading_env() -> Dict[str, str]:
+    """Collect AutoTradingAgent environment overrides that are actually set"""
+    overrides = {
+        "AUTO_TRADING_EXCHANGE": os.getenv("AUTO_TRADING_EXCHANGE"),
+    }
+    return {key: value for key, value in overrides.items() if value not in (None, "")}
+
+
+def get_agent_env(agent_name: str) -> Optional[Dict[str, str]]:
+    """Build the child environment for an agent
+
+    Returns None (inherit the launcher environment unchanged) unless the
+    agent has overrides to apply.
+    """
+    if agent_name == AUTO_TRADING_AGENT_NAME:
+        extra_env = get_auto_trading_env()
+        if extra_env:
+            return {**os.environ, **extra_env}
+    return None
+
+
+# Mapping from agent name to launch argv, built only for the agents in AGENTS
+# Commands are executed directly (no shell), so paths need no quoting
+MAP_NAME_COMMAND: Mapping[str, List[str]] = MappingProxyType(
+    {name: build_agent_command(name) for name in AGENTS}
 )
+BACKEND_COMMAND = uv_run_command(PYTHON_DIR_STR, "-m", "valuecell.server.main")
+BACKEND_NAME = "backend"
 FRONTEND_URL = "http://localhost:1420"
 
+# Start each child in its own process group so the whole tree (uv and the
+# Python process it runs) can be signalled at once on shutdown
+if os.name == "nt":
+    POPEN_GROUP_KWARGS = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    POPEN_GROUP_KWARGS = {"start_new_session": True}
+
+# Seconds to wait after the first shutdown signal before killing stragglers
+SHUTDOWN_TIMEOUT = 10
+
 
 def check_envfile_is_set():
-    if not ENV_PATH.exists():
+    try:
+        os.stat(ENV_PATH_STR)
+    except FileNotFoundError:
         print(
             f".env file not found at {ENV_PATH}. Please create it with necessary environment variables. "
             "check python/.env.example for reference."
@@ -101,33 +177,152 @@ def check_envfile_is_set():
         exit(1)
 
 
-def validate_agents_before_launch(agents: list[str]) -> bool:
+def collect_config_env_vars(node, names: set) -> None:
+    """Collect the environment variable names a parsed config refers to
+
+    Covers connection api_key_env/endpoint_env values, env_overrides keys and
+    ${VAR} references.
+
+    Args:
+        node: Parsed YAML value
+        names: Set the names are added to
+    """
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key in ("api_key_env", "endpoint_env") and isinstance(value, str):
+                names.add(value)
+            elif key == "env_overrides" and isinstance(value, dict):
+                names.update(value)
+            collect_config_env_vars(value, names)
+    elif isinstance(node, list):
+        for item in node:
+            collect_config_env_vars(item, names)
+    elif isinstance(node, str):
+        names.update(ENV_REFERENCE_PATTERN.findall(node))
+
+
+def compute_validation_fingerprint() -> str:
+    """Fingerprint every input agent validation depends on
+
+    Covers all config YAML files, the .env file, the validator sources, the
+    installed package version and every environment variable the configs or
+    the config manager read, so any change to them invalidates the cache.
+    """
+    import yaml
+
+    digest = hashlib.sha256()
+    env_vars = set(CONFIG_MANAGER_ENV_VARS)
+    config_paths = sorted(CONFIGS_DIR.rglob("*.yaml"))
+    for path in config_paths + [ENV_PATH, *VALIDATION_SOURCE_PATHS]:
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            continue
+        digest.update(path.as_posix().encode() + b"\0" + data + b"\0")
+        if path.suffix == ".yaml":
+            try:
+                collect_config_env_vars(yaml.safe_load(data), env_vars)
+            except yaml.YAMLError:
+                # Its bytes are hashed above; validation reports the error
+                pass
+
+    try:
+        version = importlib.metadata.version("valuecell")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    digest.update(f"version={version}\0".encode())
+
+    for key in sorted(env_vars):
+        # repr() keeps an unset variable distinct from an empty one
+        digest.update(f"{key}={os.environ.get(key)!r}\0".encode())
+    return digest.hexdigest()
+
+
+def load_validation_cache(fingerprint: str) -> Dict[str, tuple[bool, list[str]]]:
+    """Load cached validation results if they match the current fingerprint
+
+    An unreadable or malformed cache yields no results, so it is rebuilt.
+    """
+    try:
+        with open(VALIDATION_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("fingerprint") != fingerprint:
+            return {}
+        return {
+            agent_name: (bool(is_valid), [str(warning) for warning in warnings])
+            for agent_name, (is_valid, warnings) in data.get("agents", {}).items()
+        }
+    except (OSError, AttributeError, TypeError, ValueError):
+        return {}
+
+
+def save_validation_cache(
+    fingerprint: str, results: Dict[str, tuple[bool, list[str]]]
+) -> None:
+    """Persist validation results; failures to write are not fatal"""
+    try:
+        VALIDATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(VALIDATION_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint, "agents": results}, f)
+    except OSError as e:
+        print(f"⚠️  Could not write validation cache: {e}")
+
+
+def validate_agents_before_launch(agents: Sequence[str]) -> bool:
     """Validate agent configurations before starting
-    
+
+    Results are cached in VALIDATION_CACHE_PATH and reused while the inputs
+    covered by compute_validation_fingerprint are unchanged. Results whose
+    validation raised are reported but never cached. Set
+    VALUECELL_SKIP_VALIDATION=1 to skip validation entirely.
+
     Args:
-        agents: List of agent names to validate
-        
+        agents: Agent names to validate, as listed in MAP_NAME_CONFIG
+
     Returns:
         True if all agents are valid, False otherwise
     """
+    if os.getenv("VALUECELL_SKIP_VALIDATION") == "1":
+        print("Skipping validation checks (VALUECELL_SKIP_VALIDATION=1)")
+        return True
+
     try:
-        from valuecell.utils.config_validator import validate_agent_config
-        
+        fingerprint = compute_validation_fingerprint()
+        # Results are keyed by config name, the name the validator understands
+        results = load_validation_cache(fingerprint)
+        config_names = [MAP_NAME_CONFIG[agent_name] for agent_name in agents]
+
+        pending = [name for name in config_names if name not in results]
+        if pending:
+            from valuecell.utils.config_validator import (
+                VALIDATION_ERROR_PREFIX,
+                validate_agent_config,
+            )
+
+            for config_name in pending:
+                results[config_name] = validate_agent_config(config_name)
+
+            # validate_agent_config reports exceptions as warnings; keep those
+            # possibly transient failures out of the cache
+            cacheable = {
+                agent_name: (is_valid, warnings)
+                for agent_name, (is_valid, warnings) in results.items()
+                if not any(w.startswith(VALIDATION_ERROR_PREFIX) for w in warnings)
+            }
+            save_validation_cache(fingerprint, cacheable)
+
+        # Report in agent order so output stays deterministic
         all_valid = True
-        for agent_name in agents:
-            try:
-                is_valid, warnings = validate_agent_config(agent_name)
-                if warnings:
-                    print(f"⚠️  {agent_name} configuration warnings:")
-                    for warning in warnings:
-                        print(f"   - {warning}")
-                    print()
-                    if not is_valid:
-                        all_valid = False
-            except Exception as e:
-                print(f"❌ Failed to validate {agent_name}: {e}")
-                all_valid = False
-        
+        for agent_name, config_name in zip(agents, config_names):
+            is_valid, warnings = results[config_name]
+            if warnings:
+                print(f"⚠️  {agent_name} configuration warnings:")
+                for warning in warnings:
+                    print(f"   - {warning}")
+                print()
+                if not is_valid:
+                    all_valid = False
+
         return all_valid
     except ImportError as e:
         print(f"⚠️  Could not import config validator: {e}")
@@ -139,6 +334,114 @@ def validate_agents_before_launch(agents: list[str]) -> bool:
         return True
 
 
+@dataclass(slots=True)
+class AgentHandle:
+    """A launched agent (or backend) process and where its output goes"""
+
+    popen: subprocess.Popen
+    logpath: str
+
+
+def wait_for_processes(handles: Dict[str, AgentHandle]) -> None:
+    """Block until every launched process has exited
+
+    On Linux all children are watched at once through pidfds registered in a
+    single poll set; other platforms fall back to waiting on each in turn.
+
+    Args:
+        handles: Launched processes keyed by agent name
+    """
+    if not hasattr(os, "pidfd_open"):
+        for name, handle in handles.items():
+            report_exit(name, handle.popen.wait())
+        return
+
+    poller = select.poll()
+    pending: Dict[int, str] = {}
+    try:
+        for name, handle in handles.items():
+            pidfd = os.pidfd_open(handle.popen.pid)
+            poller.register(pidfd, select.POLLIN)
+            pending[pidfd] = name
+    except OSError:
+        # pidfd_open unsupported by the running kernel
+        for pidfd in pending:
+            os.close(pidfd)
+        for name, handle in handles.items():
+            report_exit(name, handle.popen.wait())
+        return
+
+    while pending:
+        for pidfd, _ in poller.poll():
+            name = pending.pop(pidfd)
+            poller.unregister(pidfd)
+            os.close(pidfd)
+            # Reap the exited child (waitpid with WNOHANG)
+            report_exit(name, handles[name].popen.poll())
+
+
+def report_exit(name: str, returncode: Optional[int]) -> None:
+    """Print how a launched process finished"""
+    print(f"{name} exited with code {returncode}")
+
+
+def terminate_processes(handles: Dict[str, AgentHandle], force: bool = False) -> None:
+    """Ask every still-running process group to shut down
+
+    Args:
+        handles: Processes started with POPEN_GROUP_KWARGS, keyed by name
+        force: Kill the processes instead of asking them to exit
+    """
+    for handle in handles.values():
+        process = handle.popen
+        if process.returncode is not None:
+            continue
+        try:
+            if os.name == "nt":
+                if force:
+                    process.kill()
+                else:
+                    process.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except OSError:
+            # Group already gone
+            pass
+
+
+def install_shutdown_handlers(handles: Dict[str, AgentHandle]) -> None:
+    """Forward termination signals to every launched process group
+
+    Children run in their own process groups, so the terminal's Ctrl-C and
+    hangup no longer reach them. The first SIGINT/SIGTERM/SIGHUP asks every
+    group to exit; a second signal, or SHUTDOWN_TIMEOUT elapsing (where
+    SIGALRM exists), kills whatever is still running.
+
+    Args:
+        handles: Launched processes keyed by name; may be filled in later
+    """
+    shutdown_requested = False
+
+    def kill_processes(signum, frame):
+        terminate_processes(handles, force=True)
+
+    def request_shutdown(signum, frame):
+        nonlocal shutdown_requested
+        if shutdown_requested:
+            kill_processes(signum, frame)
+            return
+        shutdown_requested = True
+        terminate_processes(handles)
+        if hasattr(signal, "SIGALRM"):
+            signal.alarm(SHUTDOWN_TIMEOUT)
+
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, kill_processes)
+    for name in ("SIGINT", "SIGTERM", "SIGHUP"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), request_shutdown)
+
+
 def main():
     check_envfile_is_set()
     
@@ -147,7 +450,7 @@ def main():
     validate_agents_before_launch(AGENTS)
     print()
     
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    timestamp = time.strftime("%Y%m%d%H%M%S")
     log_dir = f"{PROJECT_DIR_STR}/logs/{timestamp}"
 
     # Use questionary multi-select to allow choosing multiple agents
@@ -164,21 +467,25 @@ def main():
     os.makedirs(log_dir, exist_ok=True)
     print(f"Logs will be saved to {log_dir}/")
 
-    processes = []
-    logfiles = []
+    handles: Dict[str, AgentHandle] = {}
+    install_shutdown_handlers(handles)
     for selected_agent in selected_agents:
         logfile_path = f"{log_dir}/{selected_agent}.log"
         print(f"Starting agent: {selected_agent} - output to {logfile_path}")
 
-        # Open logfile for writing
-        logfile = open(logfile_path, "w")
-        logfiles.append(logfile)
-
-        # Launch command using Popen with output redirected to logfile
-        process = subprocess.Popen(
-            MAP_NAME_COMMAND[selected_agent], shell=True, stdout=logfile, stderr=logfile
-        )
-        processes.append(process)
+        # Open logfile in binary mode; children write to the fd directly.
+        # The child keeps its own copy of the fd, so the parent's is closed
+        # as soon as Popen returns. Other fds are closed in the child
+        # (close_fds defaults to True).
+        with open(logfile_path, "wb") as logfile:
+            process = subprocess.Popen(
+                MAP_NAME_COMMAND[selected_agent],
+                env=get_agent_env(selected_agent),
+                stdout=logfile,
+                stderr=logfile,
+                **POPEN_GROUP_KWARGS,
+            )
+        handles[selected_agent] = AgentHandle(process, logfile_path)
     print("All agents launched. Waiting for tasks...")
 
     for selected_agent in selected_agents:
@@ -187,20 +494,19 @@ def main():
         )
 
     # Launch backend
-    logfile_path = f"{log_dir}/backend.log"
+    logfile_path = f"{log_dir}/{BACKEND_NAME}.log"
     print(f"Starting backend - output to {logfile_path}")
     print(f"Frontend available at {FRONTEND_URL}")
-    logfile = open(logfile_path, "w")
-    logfiles.append(logfile)
-    process = subprocess.Popen(
-        BACKEND_COMMAND, shell=True, stdout=logfile, stderr=logfile
-    )
-    processes.append(process)
-
-    for process in processes:
-        process.wait()
-    for logfile in logfiles:
-        logfile.close()
+    with open(logfile_path, "wb") as logfile:
+        process = subprocess.Popen(
+            BACKEND_COMMAND,
+            stdout=logfile,
+            stderr=logfile,
+            **POPEN_GROUP_KWARGS,
+        )
+    handles[BACKEND_NAME] = AgentHandle(process, logfile_path)
+
+    wait_for_processes(handles)
     print(f"All agents finished. Check {log_dir}/ for output.")
 
 
@@ -17,12 +17,29 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import asyncio
+import functools
 import logging
-from unittest.mock import AsyncMock
 
 from valuecell.agents.auto_trading_agent.models import TradingRequest
+from valuecell.agents.tests.stubs import StubTaskUpdater
 from valuecell.utils.config_validator import print_validation_report, validate_all_agents
 
+# Manual script run directly, not a pytest module
+__test__ = False
+
+# Python project root (parent of scripts/)
+PYTHON_DIR = Path(__file__).parent.parent
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml(path: str, mtime_ns: int):
+    """Parse a YAML file, memoized by path and modification time"""
+    import yaml
+
+    # CSafeLoader is only exposed when PyYAML is built against libyaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(Path(path).read_bytes(), Loader=loader)
+
 
 def test_1_config_validation():
     """Test 1: Configuration Validation"""
@@ -40,13 +57,13 @@ def test_1_config_validation():
         return False
 
 
-def test_2_autotrading_parsing():
+async def test_2_autotrading_parsing():
     """Test 2: AutoTradingAgent Parsing Improvements"""
     print("\n" + "=" * 80)
     print("TEST 2: AutoTradingAgent Parsing Error Handling")
     print("=" * 80)
 
-    async def run_test():
+    try:
         print("\nTest 2.1: Parser returns string error (should raise ValueError)")
         try:
             # Simulate parser returning error string
@@ -81,9 +98,6 @@ def test_2_autotrading_parsing():
             )
 
             # Type check passes
-            if isinstance(valid_request, str):
-                raise ValueError("Should not be string")
-
             if isinstance(valid_request, TradingRequest):
                 # Can safely call model_dump()
                 request_dict = valid_request.model_dump()
@@ -106,15 +120,9 @@ def test_2_autotrading_parsing():
         except Exception as e:
             print(f"✅ Correctly rejected negative capital: {type(e).__name__}")
 
+        print("\n✅ AutoTradingAgent parsing tests passed")
         return True
 
-    try:
-        result = asyncio.run(run_test())
-        if result:
-            print("\n✅ AutoTradingAgent parsing tests passed")
-        else:
-            print("\n❌ AutoTradingAgent parsing tests failed")
-        return result
     except Exception as e:
         print(f"\n❌ AutoTradingAgent parsing tests failed with error: {e}")
         return False
@@ -127,18 +135,15 @@ def test_3_research_embedding():
     print("=" * 80)
 
     try:
-        import yaml
-
-        config_path = (
-            Path(__file__).parent.parent / "configs" / "agents" / "research_agent.yaml"
-        )
+        config_path = PYTHON_DIR / "configs" / "agents" / "research_agent.yaml"
 
-        if not config_path.exists():
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
             print(f"⚠️  Config file not found: {config_path}")
             return True  # Skip test
 
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml(str(config_path), mtime_ns)
 
         print("\nTest 3.1: Checking embedding provider configuration")
         # Embedding config is under models.embedding, not top-level embedding
@@ -177,21 +182,18 @@ def test_3_research_embedding():
         return False
 
 
-def test_4_state_management():
+async def test_4_state_management():
     """Test 4: State Management Improvements"""
     print("\n" + "=" * 80)
     print("TEST 4: State Management (No Double Complete)")
     print("=" * 80)
 
-    async def run_test():
+    try:
         from a2a.types import TaskState
-        from unittest.mock import AsyncMock
 
         print("\nTest 4.1: Exception sets terminal state, prevents double complete")
 
-        mock_updater = AsyncMock()
-        mock_updater.update_status = AsyncMock()
-        mock_updater.complete = AsyncMock()
+        mock_updater = StubTaskUpdater()
 
         # Simulate agent with error
         task_terminated = False
@@ -207,16 +209,15 @@ def test_4_state_management():
                 await mock_updater.complete()
 
         # Check that complete() was NOT called
-        if mock_updater.complete.call_count == 0:
+        if mock_updater.complete_calls == 0:
             print("✅ complete() not called after terminal state (correct)")
         else:
-            print(f"❌ complete() called {mock_updater.complete.call_count} times (bug!)")
+            print(f"❌ complete() called {mock_updater.complete_calls} times (bug!)")
             return False
 
         print("\nTest 4.2: Normal execution still completes properly")
 
-        mock_updater2 = AsyncMock()
-        mock_updater2.complete = AsyncMock()
+        mock_updater2 = StubTaskUpdater()
 
         task_terminated2 = False
         try:
@@ -229,23 +230,17 @@ def test_4_state_management():
                 await mock_updater2.complete()
 
         # Check that complete() WAS called
-        if mock_updater2.complete.call_count == 1:
+        if mock_updater2.complete_calls == 1:
             print("✅ complete() called once for successful execution (correct)")
         else:
             print(
-                f"❌ complete() called {mock_updater2.complete.call_count} times (expected 1)"
+                f"❌ complete() called {mock_updater2.complete_calls} times (expected 1)"
             )
             return False
 
+        print("\n✅ State management tests passed")
         return True
 
-    try:
-        result = asyncio.run(run_test())
-        if result:
-            print("\n✅ State management tests passed")
-        else:
-            print("\n❌ State management tests failed")
-        return result
     except Exception as e:
         print(f"\n❌ State management tests failed with error: {e}")
         return False
@@ -294,18 +289,34 @@ def test_5_integration():
 
 def main():
     """Run all manual tests"""
+    # Batch the many small prints into block-sized writes even on a terminal;
+    # everything is flushed once at the end of the run
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     print("\n" + "=" * 80)
     print("VALUECELL AGENT FIXES - MANUAL VALIDATION")
     print("=" * 80)
 
     results = []
 
-    # Run all tests
-    results.append(("Configuration Validation", test_1_config_validation()))
-    results.append(("AutoTradingAgent Parsing", test_2_autotrading_parsing()))
-    results.append(("ResearchAgent Embedding", test_3_research_embedding()))
-    results.append(("State Management", test_4_state_management()))
-    results.append(("Integration Tests", test_5_integration()))
+    # Share one event loop across the async tests
+    loop = asyncio.new_event_loop()
+    try:
+        # Run all tests
+        results.append(("Configuration Validation", test_1_config_validation()))
+        results.append(
+            (
+                "AutoTradingAgent Parsing",
+                loop.run_until_complete(test_2_autotrading_parsing()),
+            )
+        )
+        results.append(("ResearchAgent Embedding", test_3_research_embedding()))
+        results.append(
+            ("State Management", loop.run_until_complete(test_4_state_management()))
+        )
+        results.append(("Integration Tests", test_5_integration()))
+    finally:
+        loop.close()
 
     # Summary
     print("\n" + "=" * 80)
@@ -324,10 +335,13 @@ def main():
 
     if passed == total:
         print("\n🎉 All manual tests completed successfully!")
-        return 0
+        exit_code = 0
     else:
         print(f"\n⚠️  {total - passed} test(s) failed")
-        return 1
+        exit_code = 1
+
+    sys.stdout.flush()
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -519,16 +519,19 @@ class AutoTradingAgent(BaseAgent):
             response = await self.parser_agent.arun(parse_prompt)
             trading_request = response.content
 
-            # Validate response type
-            if isinstance(trading_request, str):
-                # Parser failed - response.content is error message
-                logger.error(f"Parser returned string instead of TradingRequest: {trading_request}")
-                raise ValueError(
-                    f"Could not parse trading configuration from query: {query}\n"
-                    f"Parser error: {trading_request}"
-                )
-
+            # Validate response type (a single check on the success path)
             if not isinstance(trading_request, TradingRequest):
+                if isinstance(trading_request, str):
+                    # Parser failed - response.content is error message
+                    logger.error(
+                        "Parser returned string instead of TradingRequest: "
+                        f"{trading_request}"
+                    )
+                    raise ValueError(
+                        f"Could not parse trading configuration from query: {query}\n"
+                        f"Parser error: {trading_request}"
+                    )
+
                 logger.error(f"Unexpected response type: {type(trading_request)}")
                 raise ValueError(
                     f"Parser returned unexpected type: {type(trading_request).__name__}"
@@ -0,0 +1,17 @@
+"""Lightweight stand-ins shared by the agent tests and the manual test script"""
+
+
+class StubTaskUpdater:
+    """Lightweight TaskUpdater stand-in that counts awaited calls"""
+
+    def __init__(self):
+        self.status_calls = 0
+        self.complete_calls = 0
+        self.last_status = None
+
+    async def update_status(self, state, *args, **kwargs):
+        self.status_calls += 1
+        self.last_status = state
+
+    async def complete(self, *args, **kwargs):
+        self.complete_calls += 1
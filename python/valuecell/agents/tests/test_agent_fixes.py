@@ -10,18 +10,88 @@ Tests verify:
 """
 
 import asyncio
+import functools
 import logging
 from pathlib import Path
-from typing import Any, Dict
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
 from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 import pytest
 import yaml
 from a2a.types import TaskState
-
-from valuecell.agents.auto_trading_agent.models import TradingRequest
-from valuecell.config.manager import get_config_manager
-from valuecell.utils.config_validator import validate_agent_config, validate_all_agents
+from pydantic import ValidationError
+
+from valuecell.agents.tests.stubs import StubTaskUpdater
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+_EXPECTED_AGENTS = frozenset({"research_agent", "auto_trading_agent", "news_agent"})
+
+_REPO_ROOT = Path(__file__).resolve().parents[4]
+_CONFIGS_DIR = _REPO_ROOT / "python" / "configs" / "agents"
+_RESEARCH_YAML_PATH = _CONFIGS_DIR / "research_agent.yaml"
+_RESEARCH_YAML_EXISTS = _RESEARCH_YAML_PATH.is_file()
+
+# Expected shape of the research agent's embedding config
+_RESEARCH_EMBEDDING_SCHEMA = {
+    "type": "object",
+    "required": ["models"],
+    "properties": {
+        "models": {
+            "type": "object",
+            "required": ["embedding"],
+            "properties": {
+                "embedding": {
+                    "type": "object",
+                    "required": ["provider", "model_id", "provider_models"],
+                    "properties": {
+                        "provider": {"const": "google"},
+                        "model_id": {"const": "gemini-embedding-001"},
+                        "provider_models": {"type": "object", "minProperties": 1},
+                    },
+                },
+            },
+        },
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_agent_yaml(path: str) -> dict:
+    """Parse an agent YAML file once per test run"""
+    # One read of the whole file; the loader parses from memory
+    return yaml.load(Path(path).read_bytes(), Loader=_YamlLoader)
+
+
+def _fake_agent_config(provider: str, embedding_provider: Optional[str] = None):
+    """Minimal stand-in for an enabled AgentConfig"""
+    embedding_model = None
+    if embedding_provider:
+        embedding_model = SimpleNamespace(provider=embedding_provider)
+    return SimpleNamespace(
+        enabled=True,
+        primary_model=SimpleNamespace(provider=provider),
+        embedding_model=embedding_model,
+    )
+
+
+_RESEARCH_AGENT_MODULE = "valuecell.agents.research_agent.core"
+
+
+def _research_embedding_provider_available(config_manager) -> bool:
+    """Whether research_agent's embedding provider is configured with an API key"""
+    agent_config = config_manager.get_agent_config("research_agent")
+    if not agent_config or not agent_config.embedding_model:
+        return False
+    is_valid, _ = config_manager.validate_provider(
+        agent_config.embedding_model.provider
+    )
+    return is_valid
 
 
 class MockAgentResponse:
@@ -40,7 +110,9 @@ class TestAutoTradingParsingFix:
     """Test AutoTradingAgent parser error handling improvements"""
 
     @pytest.mark.asyncio
-    async def test_autotrading_parser_returns_string(self):
+    async def test_autotrading_parser_returns_string(
+        self, TradingRequest, mock_parser_agent
+    ):
         """
         Test: Parser returning string error is handled gracefully
         Validates: Lines 523-529 in agent.py - type checking before .model_dump()
@@ -53,12 +125,11 @@ class TestAutoTradingParsingFix:
             agent.logger = logging.getLogger("test")
 
             # Mock parser_agent that returns error string instead of TradingRequest
-            mock_parser = AsyncMock()
             error_response = MockAgentResponse(
                 content="Could not parse query - invalid format"
             )
-            mock_parser.arun.return_value = error_response
-            agent.parser_agent = mock_parser
+            mock_parser_agent.arun.return_value = error_response
+            agent.parser_agent = mock_parser_agent
 
             # Test the _parse_trading_query method
             query = "hello world"
@@ -73,13 +144,14 @@ class TestAutoTradingParsingFix:
                 trading_request = response.content
 
                 # This is the critical type check that was added
-                if isinstance(trading_request, str):
-                    raise ValueError(
-                        f"Could not parse trading configuration from query: {query}\n"
-                        f"Parser error: {trading_request}"
-                    )
-
                 if not isinstance(trading_request, TradingRequest):
+                    if isinstance(trading_request, str):
+                        raise ValueError(
+                            "Could not parse trading configuration "
+                            f"from query: {query}\n"
+                            f"Parser error: {trading_request}"
+                        )
+
                     raise ValueError(
                         f"Parser returned unexpected type: {type(trading_request).__name__}"
                     )
@@ -90,7 +162,9 @@ class TestAutoTradingParsingFix:
             assert query in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_autotrading_invalid_query_no_attribute_error(self):
+    async def test_autotrading_invalid_query_no_attribute_error(
+        self, mock_parser_agent
+    ):
         """
         Test: Invalid queries don't cause AttributeError crash
         Expected: ValueError with clear message, no AttributeError
@@ -102,10 +176,9 @@ class TestAutoTradingParsingFix:
             agent.logger = logging.getLogger("test")
 
             # Mock parser that returns string (simulating parse failure)
-            mock_parser = AsyncMock()
             error_response = MockAgentResponse(content="Unable to parse: invalid input")
-            mock_parser.arun.return_value = error_response
-            agent.parser_agent = mock_parser
+            mock_parser_agent.arun.return_value = error_response
+            agent.parser_agent = mock_parser_agent
 
             query = "this is not a trading query"
 
@@ -127,7 +200,9 @@ class TestAutoTradingParsingFix:
             assert isinstance(exc_info.value, ValueError)
 
     @pytest.mark.asyncio
-    async def test_autotrading_valid_query_succeeds(self):
+    async def test_autotrading_valid_query_succeeds(
+        self, TradingRequest, mock_parser_agent
+    ):
         """
         Test: Valid queries still work correctly
         Expected: TradingRequest object with correct fields
@@ -139,22 +214,20 @@ class TestAutoTradingParsingFix:
             agent.logger = logging.getLogger("test")
 
             # Mock parser that returns valid TradingRequest
-            mock_parser = AsyncMock()
             valid_request = TradingRequest(
                 crypto_symbols=["BTC-USD"],
                 initial_capital=10000.0,
                 use_ai_signals=True,
             )
             valid_response = MockAgentResponse(content=valid_request)
-            mock_parser.arun.return_value = valid_response
-            agent.parser_agent = mock_parser
+            mock_parser_agent.arun.return_value = valid_response
+            agent.parser_agent = mock_parser_agent
 
             # Test successful parsing
             response = await agent.parser_agent.arun("Trade BTC-USD with $10000")
             trading_request = response.content
 
-            # Validate type checks pass
-            assert not isinstance(trading_request, str)
+            # Validate type check passes
             assert isinstance(trading_request, TradingRequest)
 
             # Validate can call .model_dump() safely
@@ -179,12 +252,8 @@ class TestStateManagementFix:
         Expected: Task state = failed, no RuntimeError about terminal state
         Validates: Lines 214-222 in decorator.py - finally block fix
         """
-        from a2a.server.tasks import TaskUpdater
-
-        # Create mock updater
-        mock_updater = AsyncMock(spec=TaskUpdater)
-        mock_updater.update_status = AsyncMock()
-        mock_updater.complete = AsyncMock()
+        # Create stub updater
+        mock_updater = StubTaskUpdater()
 
         # Create a function that raises an error
         async def failing_agent(*args, **kwargs):
@@ -204,11 +273,11 @@ class TestStateManagementFix:
                 await mock_updater.complete()
 
         # Verify: update_status(failed) was called
-        mock_updater.update_status.assert_called_once()
-        assert mock_updater.update_status.call_args[0][0] == TaskState.failed
+        assert mock_updater.status_calls == 1
+        assert mock_updater.last_status == TaskState.failed
 
         # Verify: complete() was NOT called (terminal state flag worked)
-        mock_updater.complete.assert_not_called()
+        assert mock_updater.complete_calls == 0
 
     @pytest.mark.asyncio
     async def test_decorator_normal_completion_works(self):
@@ -216,11 +285,7 @@ class TestStateManagementFix:
         Test: Normal execution still completes properly
         Expected: Task state = completed, complete() called once
         """
-        from a2a.server.tasks import TaskUpdater
-
-        mock_updater = AsyncMock(spec=TaskUpdater)
-        mock_updater.update_status = AsyncMock()
-        mock_updater.complete = AsyncMock()
+        mock_updater = StubTaskUpdater()
 
         # Successful agent execution
         async def successful_agent(*args, **kwargs):
@@ -238,7 +303,7 @@ class TestStateManagementFix:
                 await mock_updater.complete()
 
         # Verify: complete() WAS called (no error, so not terminated)
-        mock_updater.complete.assert_called_once()
+        assert mock_updater.complete_calls == 1
 
     @pytest.mark.asyncio
     async def test_decorator_respects_terminal_states(self):
@@ -246,14 +311,10 @@ class TestStateManagementFix:
         Test: All terminal states prevent double-complete
         Expected: cancelled/failed states don't trigger complete()
         """
-        from a2a.server.tasks import TaskUpdater
-
         terminal_states = [TaskState.failed, TaskState.completed, TaskState.canceled]
 
         for terminal_state in terminal_states:
-            mock_updater = AsyncMock(spec=TaskUpdater)
-            mock_updater.update_status = AsyncMock()
-            mock_updater.complete = AsyncMock()
+            mock_updater = StubTaskUpdater()
 
             # Simulate agent that sets terminal state
             task_terminated = False
@@ -268,7 +329,7 @@ class TestStateManagementFix:
                     await mock_updater.complete()
 
             # Verify complete() not called for terminal state
-            mock_updater.complete.assert_not_called()
+            assert mock_updater.complete_calls == 0
 
 
 # =============================================================================
@@ -279,24 +340,25 @@ class TestStateManagementFix:
 class TestResearchEmbeddingConfig:
     """Test ResearchAgent embedding configuration"""
 
-    def test_research_embedding_provider_config(self):
+    def test_research_embedding_provider_config(self, research_embedding_validator):
         """
         Test: ResearchAgent has correct embedding provider
         Expected: provider = "google", uses gemini-embedding-001
-        Validates: Lines 26-32 in research_agent.yaml
+        Validates: models.embedding in research_agent.yaml
         """
         # Load the research_agent.yaml directly
-        config_path = Path(__file__).parent.parent.parent.parent.parent / "configs" / "agents" / "research_agent.yaml"
-        
-        if not config_path.exists():
-            pytest.skip(f"Config file not found: {config_path}")
+        if not _RESEARCH_YAML_EXISTS:
+            pytest.skip(f"Config file not found: {_RESEARCH_YAML_PATH}")
+
+        config = _load_agent_yaml(str(_RESEARCH_YAML_PATH))
 
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        # Fail fast on the overall shape before the detailed assertions
+        research_embedding_validator.validate(config)
 
-        # Check embedding configuration
-        assert "embedding" in config, "Embedding config missing"
-        embedding_config = config["embedding"]
+        # Check embedding configuration (nested under models)
+        models_config = config.get("models", {})
+        assert "embedding" in models_config, "Embedding config missing"
+        embedding_config = models_config["embedding"]
 
         # Verify primary provider is google
         assert embedding_config["provider"] == "google", "Provider should be 'google'"
@@ -316,15 +378,12 @@ class TestResearchEmbeddingConfig:
         Test: ResearchAgent embedding config has proper fallback chain
         Expected: Multiple provider options configured
         """
-        config_path = Path(__file__).parent.parent.parent.parent.parent / "configs" / "agents" / "research_agent.yaml"
-        
-        if not config_path.exists():
-            pytest.skip(f"Config file not found: {config_path}")
+        if not _RESEARCH_YAML_EXISTS:
+            pytest.skip(f"Config file not found: {_RESEARCH_YAML_PATH}")
 
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = _load_agent_yaml(str(_RESEARCH_YAML_PATH))
 
-        embedding_config = config["embedding"]
+        embedding_config = config["models"]["embedding"]
         provider_models = embedding_config.get("provider_models", {})
 
         # Should have at least one fallback option
@@ -347,7 +406,7 @@ class TestResearchEmbeddingConfig:
 class TestConfigurationValidation:
     """Test configuration validation utilities"""
 
-    def test_validate_single_agent_function_exists(self):
+    def test_validate_single_agent_function_exists(self, validate_agent_config):
         """
         Test: validate_agent_config function works
         Expected: Returns (is_valid, warnings) tuple
@@ -363,7 +422,67 @@ class TestConfigurationValidation:
         for warning in warnings:
             assert isinstance(warning, str), "Warnings should be strings"
 
-    def test_validate_all_agents_function_works(self):
+    def test_validate_agent_config_is_memoized(
+        self, fake_config_manager, validate_agent_config, clear_validation_cache
+    ):
+        """
+        Test: Repeated validation reuses the cached result
+        Expected: One config load and provider check until the cache is cleared
+        """
+        fake_config_manager.get_agent_config.return_value = _fake_agent_config(
+            "google"
+        )
+
+        first = validate_agent_config("research_agent")
+        second = validate_agent_config("research_agent")
+
+        assert first == second == (True, [])
+        assert first[1] is not second[1], "Each caller should get its own list"
+        fake_config_manager.get_agent_config.assert_called_once_with("research_agent")
+        fake_config_manager.validate_provider.assert_called_once_with("google")
+
+        clear_validation_cache()
+        assert validate_agent_config("research_agent") == first
+        assert fake_config_manager.get_agent_config.call_count == 2
+        assert fake_config_manager.validate_provider.call_count == 2
+
+    def test_validate_agent_config_checks_shared_provider_once(
+        self, fake_config_manager, validate_agent_config
+    ):
+        """
+        Test: Primary and embedding models on the same provider
+        Expected: The provider is checked once for the agent
+        """
+        fake_config_manager.get_agent_config.return_value = _fake_agent_config(
+            "google", embedding_provider="google"
+        )
+
+        assert validate_agent_config("research_agent") == (True, [])
+        fake_config_manager.validate_provider.assert_called_once_with("google")
+
+    def test_validate_all_agents_checks_each_provider_once(
+        self, fake_config_manager, validate_all_agents
+    ):
+        """
+        Test: Several agents sharing providers
+        Expected: Each distinct provider is checked exactly once
+        """
+        configs = {
+            "research_agent": _fake_agent_config("google", embedding_provider="google"),
+            "news_agent": _fake_agent_config("google"),
+            "auto_trading_agent": _fake_agent_config("openrouter"),
+        }
+        fake_config_manager.list_agents.return_value = list(configs)
+        fake_config_manager.get_agent_config.side_effect = configs.get
+
+        results = validate_all_agents()
+
+        assert results == {agent_name: (True, []) for agent_name in configs}
+        provider_calls = fake_config_manager.validate_provider.call_args_list
+        checked = [call.args[0] for call in provider_calls]
+        assert sorted(checked) == ["google", "openrouter"]
+
+    def test_validate_all_agents_function_works(self, validate_all_agents):
         """
         Test: validate_all_agents function works
         Expected: Dict with agent names and validation results
@@ -383,7 +502,9 @@ class TestConfigurationValidation:
             assert isinstance(is_valid, bool), "Validity should be boolean"
             assert isinstance(warnings, list), "Warnings should be list"
 
-    def test_validation_detects_config_issues(self):
+    def test_validation_detects_config_issues(
+        self, validate_agent_config, validate_all_agents
+    ):
         """
         Test: Validator can detect configuration problems
         Expected: Returns warnings for misconfigured agents
@@ -397,13 +518,35 @@ class TestConfigurationValidation:
         # Test validation with all agents
         results = validate_all_agents()
 
-        # Should have results for existing agents
-        agent_names = list(results.keys())
-        expected_agents = ["research_agent", "auto_trading_agent", "news_agent"]
+        # Should have results for existing agents (dict_keys supports set ops)
+        agent_names = results.keys()
 
         # At least some expected agents should be present
-        found_agents = [a for a in expected_agents if a in agent_names]
-        assert len(found_agents) > 0, f"Should find at least one agent from {expected_agents}"
+        found_agents = _EXPECTED_AGENTS & agent_names
+        assert (
+            len(found_agents) > 0
+        ), f"Should find at least one agent from {sorted(_EXPECTED_AGENTS)}"
+
+    def test_iter_validate_all_agents_streams_results(
+        self, fake_config_manager, iter_validate_all_agents
+    ):
+        """
+        Test: Streaming validator loads and validates agents one at a time
+        Expected: Later agents are untouched until their result is requested
+        """
+        fake_config_manager.list_agents.return_value = ["first_agent", "second_agent"]
+        fake_config_manager.get_agent_config.side_effect = (
+            lambda agent_name: _fake_agent_config("google")
+        )
+
+        results = iter_validate_all_agents()
+
+        assert next(results) == ("first_agent", (True, []))
+        fake_config_manager.get_agent_config.assert_called_once_with("first_agent")
+
+        assert next(results) == ("second_agent", (True, []))
+        assert fake_config_manager.get_agent_config.call_count == 2
+        assert next(results, None) is None
 
 
 # =============================================================================
@@ -414,7 +557,7 @@ class TestConfigurationValidation:
 class TestIntegration:
     """Integration tests to ensure no regressions"""
 
-    def test_all_agent_configs_loadable(self):
+    def test_all_agent_configs_loadable(self, get_config_manager):
         """
         Test: All agent configs can be loaded without errors
         Expected: No import/config errors for any agent
@@ -434,27 +577,35 @@ class TestIntegration:
             except Exception as e:
                 pytest.fail(f"Failed to load config for {agent_name}: {e}")
 
-    def test_agent_imports_work(self):
+    @pytest.mark.parametrize(
+        "module_name",
+        [
+            "valuecell.agents.auto_trading_agent.agent",
+            _RESEARCH_AGENT_MODULE,
+            "valuecell.agents.news_agent.core",
+        ],
+    )
+    def test_agent_imports_work(self, module_name, get_config_manager):
         """
-        Test: All agent modules can be imported
+        Test: Agent module can be imported
         Expected: No import errors
         """
         import importlib
 
-        agents_to_test = [
-            "valuecell.agents.auto_trading_agent.agent",
-            "valuecell.agents.research_agent.core",
-            "valuecell.agents.news_agent.core",
-        ]
+        # research_agent builds its embedder at import time, which needs an
+        # API key for the configured embedding provider
+        if module_name == _RESEARCH_AGENT_MODULE and not (
+            _research_embedding_provider_available(get_config_manager())
+        ):
+            pytest.skip("research_agent's embedding provider has no API key")
 
-        for module_name in agents_to_test:
-            try:
-                module = importlib.import_module(module_name)
-                assert module is not None, f"Module {module_name} should import"
-            except ImportError as e:
-                pytest.fail(f"Failed to import {module_name}: {e}")
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            pytest.fail(f"Failed to import {module_name}: {e}")
+        assert module is not None, f"Module {module_name} should import"
 
-    def test_trading_request_model_validation(self):
+    def test_trading_request_model_validation(self, TradingRequest):
         """
         Test: TradingRequest model validation works correctly
         Expected: Valid requests pass, invalid requests fail
@@ -468,16 +619,16 @@ class TestIntegration:
         assert valid_request.initial_capital == 10000.0
 
         # Invalid request - negative capital
-        with pytest.raises(Exception):  # Should raise validation error
+        with pytest.raises(ValidationError):
             TradingRequest(
                 crypto_symbols=["BTC-USD"], initial_capital=-1000.0, use_ai_signals=True
             )
 
         # Invalid request - empty symbols
-        with pytest.raises(Exception):  # Should raise validation error
+        with pytest.raises(ValidationError):
             TradingRequest(crypto_symbols=[], initial_capital=10000.0, use_ai_signals=True)
 
-    def test_config_manager_singleton(self):
+    def test_config_manager_singleton(self, get_config_manager):
         """
         Test: ConfigManager singleton pattern works
         Expected: Same instance returned on multiple calls
@@ -493,10 +644,95 @@ class TestIntegration:
 # =============================================================================
 
 
+# Heavy project imports are resolved per test so collection stays cheap
+
+
+@pytest.fixture
+def TradingRequest():
+    """Fixture providing the TradingRequest model"""
+    from valuecell.agents.auto_trading_agent.models import TradingRequest
+
+    return TradingRequest
+
+
+@pytest.fixture
+def get_config_manager():
+    """Fixture providing the config manager accessor"""
+    from valuecell.config.manager import get_config_manager
+
+    return get_config_manager
+
+
+@pytest.fixture
+def validate_agent_config():
+    """Fixture providing the single-agent config validator"""
+    from valuecell.utils.config_validator import validate_agent_config
+
+    return validate_agent_config
+
+
+@pytest.fixture
+def validate_all_agents():
+    """Fixture providing the all-agents config validator"""
+    from valuecell.utils.config_validator import validate_all_agents
+
+    return validate_all_agents
+
+
+@pytest.fixture
+def iter_validate_all_agents():
+    """Fixture providing the streaming all-agents config validator"""
+    from valuecell.utils.config_validator import iter_validate_all_agents
+
+    return iter_validate_all_agents
+
+
+@pytest.fixture
+def clear_validation_cache():
+    """Fixture providing the validation memo cache reset"""
+    from valuecell.utils.config_validator import clear_validation_cache
+
+    return clear_validation_cache
+
+
+@pytest.fixture
+def fake_config_manager():
+    """Fixture replacing the validator's ConfigManager methods with mocks"""
+    from valuecell.utils import config_validator
+
+    manager = SimpleNamespace(
+        get_agent_config=Mock(return_value=None),
+        validate_provider=Mock(return_value=(True, None)),
+        list_agents=Mock(return_value=[]),
+    )
+    methods = (
+        manager.get_agent_config,
+        manager.validate_provider,
+        manager.list_agents,
+    )
+    # Keep results computed against the mocks out of the shared memo cache
+    config_validator.clear_validation_cache()
+    with patch.object(
+        config_validator, "_config_manager_methods", return_value=methods
+    ):
+        yield manager
+    config_validator.clear_validation_cache()
+
+
+@pytest.fixture(scope="session")
+def research_embedding_validator():
+    """Fixture providing a JSON-Schema validator built once per session"""
+    import jsonschema
+
+    return jsonschema.Draft202012Validator(_RESEARCH_EMBEDDING_SCHEMA)
+
+
 @pytest.fixture
 def mock_task_updater():
-    """Fixture providing a mock TaskUpdater"""
-    mock = AsyncMock()
+    """Fixture providing a mock TaskUpdater (only awaited methods are async)"""
+    from a2a.server.tasks import TaskUpdater
+
+    mock = MagicMock(spec=TaskUpdater)
     mock.update_status = AsyncMock()
     mock.complete = AsyncMock()
     return mock
@@ -504,8 +740,8 @@ def mock_task_updater():
 
 @pytest.fixture
 def mock_parser_agent():
-    """Fixture providing a mock parser agent"""
-    mock = AsyncMock()
+    """Fixture providing a mock parser agent (only arun is async)"""
+    mock = MagicMock()
     mock.arun = AsyncMock()
     return mock
 
@@ -5,14 +5,132 @@ This module provides functions to validate agent configurations before startup,
 checking for missing API keys, misconfigured providers, and other issues.
 """
 
+import functools
 import logging
-from typing import List, Tuple
+import sys
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from valuecell.config.manager import ConfigManager, get_config_manager
+from valuecell.config.manager import AgentConfig, ConfigManager, get_config_manager
 
 logger = logging.getLogger(__name__)
 
 
+# Prefix of the warning reported when validation itself raised
+VALIDATION_ERROR_PREFIX = "Validation error: "
+
+_ProviderCheck = Callable[[str], Tuple[bool, Optional[str]]]
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationResult:
+    """Outcome of validating a single agent configuration"""
+
+    is_valid: bool
+    warnings: Tuple[str, ...] = ()
+
+
+# Shared result for the common no-warning case
+_OK_RESULT = ValidationResult(True)
+
+
+@functools.cache
+def _config_manager_methods() -> Tuple[
+    Callable[[str], Optional[AgentConfig]],
+    _ProviderCheck,
+    Callable[[], List[str]],
+]:
+    """
+    Resolve the ConfigManager methods used by the validators once
+
+    Resolved lazily rather than at import time, since creating the manager
+    loads configuration from disk. The manager is a process-wide singleton,
+    so the bound methods stay valid for the life of the process.
+
+    Returns:
+        Tuple of (get_agent_config, validate_provider, list_agents)
+    """
+    config_manager: ConfigManager = get_config_manager()
+    return (
+        config_manager.get_agent_config,
+        config_manager.validate_provider,
+        config_manager.loader.list_agents,
+    )
+
+
+def _validate_loaded_agent_config(
+    agent_name: str,
+    agent_config: Optional[AgentConfig],
+    check_provider: _ProviderCheck,
+) -> ValidationResult:
+    """
+    Validate an already-loaded agent configuration
+
+    Shared by validate_agent_config (which resolves the config by name) and
+    validate_all_agents (which loads every config once up front).
+
+    Args:
+        agent_name: Agent name used in messages
+        agent_config: Loaded configuration, or None if not found
+        check_provider: Returns (is_valid, error) for a provider name
+
+    Returns:
+        ValidationResult for the agent
+    """
+    if not agent_config:
+        return ValidationResult(
+            False, (f"Agent configuration not found: {agent_name}",)
+        )
+
+    if not agent_config.enabled:
+        return ValidationResult(False, (f"Agent is disabled: {agent_name}",))
+
+    warnings: List[str] = []
+
+    # Check primary model provider
+    provider = agent_config.primary_model.provider
+    is_valid, error = check_provider(provider)
+    if not is_valid:
+        warnings.append(f"Primary provider '{provider}' unavailable: {error}")
+
+    # Check embedding provider if configured
+    if agent_config.embedding_model:
+        emb_provider = agent_config.embedding_model.provider
+        is_valid, error = check_provider(emb_provider)
+        if not is_valid:
+            warnings.append(
+                f"Embedding provider '{emb_provider}' unavailable: {error}. "
+                "Will attempt fallback to other providers."
+            )
+
+    if not warnings:
+        return _OK_RESULT
+    return ValidationResult(False, tuple(warnings))
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_agent_config_cached(agent_name: str) -> ValidationResult:
+    """
+    Memoized core of validate_agent_config
+
+    Agent YAML and provider availability do not change within a process, so
+    results are cached per agent name. Exceptions propagate and are therefore
+    never cached.
+    """
+    get_agent_config, validate_provider, _ = _config_manager_methods()
+    agent_config = get_agent_config(agent_name)
+
+    # Primary and embedding models often share a provider; check it once
+    checked: Dict[str, Tuple[bool, Optional[str]]] = {}
+
+    def check_provider(provider: str) -> Tuple[bool, Optional[str]]:
+        if provider not in checked:
+            checked[provider] = validate_provider(provider)
+        return checked[provider]
+
+    return _validate_loaded_agent_config(agent_name, agent_config, check_provider)
+
+
 def validate_agent_config(agent_name: str) -> Tuple[bool, List[str]]:
     """
     Validate agent configuration before startup
@@ -22,6 +140,9 @@ def validate_agent_config(agent_name: str) -> Tuple[bool, List[str]]:
     - Embedding provider availability (if configured)
     - API keys are set for required providers
 
+    Results are memoized per agent name; call
+    ``clear_validation_cache()`` to force re-validation.
+
     Args:
         agent_name: Agent name to validate (e.g., "ResearchAgent", "AutoTradingAgent")
 
@@ -36,48 +157,79 @@ def validate_agent_config(agent_name: str) -> Tuple[bool, List[str]]:
         ...     for warning in warnings:
         ...         print(f"Warning: {warning}")
     """
-    warnings: List[str] = []
-    config_manager: ConfigManager = get_config_manager()
-
     try:
-        agent_config = config_manager.get_agent_config(agent_name)
+        result = _validate_agent_config_cached(agent_name)
+        # Hand out a fresh list so callers cannot mutate the cached result
+        return result.is_valid, list(result.warnings)
+
+    except Exception as e:
+        logger.error(f"Error validating agent config for {agent_name}: {e}")
+        return False, [f"{VALIDATION_ERROR_PREFIX}{e}"]
 
-        if not agent_config:
-            warnings.append(f"Agent configuration not found: {agent_name}")
-            return False, warnings
 
-        if not agent_config.enabled:
-            warnings.append(f"Agent is disabled: {agent_name}")
-            return False, warnings
+def clear_validation_cache() -> None:
+    """Forget memoized validate_agent_config results"""
+    _validate_agent_config_cached.cache_clear()
 
-        # Check primary model provider
-        provider = agent_config.primary_model.provider
-        is_valid, error = config_manager.validate_provider(provider)
-        if not is_valid:
-            warnings.append(f"Primary provider '{provider}' unavailable: {error}")
 
-        # Check embedding provider if configured
-        if agent_config.embedding_model:
-            emb_provider = agent_config.embedding_model.provider
-            is_valid, error = config_manager.validate_provider(emb_provider)
-            if not is_valid:
-                warnings.append(
-                    f"Embedding provider '{emb_provider}' unavailable: {error}. "
-                    "Will attempt fallback to other providers."
-                )
+def iter_validate_all_agents() -> Iterator[Tuple[str, Tuple[bool, List[str]]]]:
+    """
+    Validate all configured agents, yielding each result as it is ready
+
+    Each agent's config is loaded and validated only when the next result is
+    requested. Provider checks are shared across agents, so each distinct
+    provider is validated once no matter how many agents use it. Use this
+    instead of validate_all_agents when results can be consumed incrementally.
 
-        return len(warnings) == 0, warnings
+    Yields:
+        (agent_name, (is_valid, warnings)) as each agent is validated
 
+    Example:
+        >>> for agent_name, (is_valid, warnings) in iter_validate_all_agents():
+        ...     print(f"{agent_name}: {'OK' if is_valid else 'WARNINGS'}")
+    """
+    get_agent_config, validate_provider, list_agents = _config_manager_methods()
+
+    try:
+        agent_names = list_agents()
     except Exception as e:
-        logger.error(f"Error validating agent config for {agent_name}: {e}")
-        warnings.append(f"Validation error: {str(e)}")
-        return False, warnings
+        logger.error(f"Error listing agents: {e}")
+        return
+
+    # Provider results shared by all agents; failures are remembered as well
+    # so a broken provider is not re-checked for every agent using it
+    provider_status: Dict[str, Union[Tuple[bool, Optional[str]], Exception]] = {}
+
+    def check_provider(provider: str) -> Tuple[bool, Optional[str]]:
+        if provider not in provider_status:
+            try:
+                provider_status[provider] = validate_provider(provider)
+            except Exception as e:
+                provider_status[provider] = e
+        status = provider_status[provider]
+        if isinstance(status, Exception):
+            raise status
+        return status
+
+    for agent_name in agent_names:
+        try:
+            agent_config = get_agent_config(agent_name)
+            result = _validate_loaded_agent_config(
+                agent_name, agent_config, check_provider
+            )
+        except Exception as e:
+            logger.error(f"Error validating agent config for {agent_name}: {e}")
+            yield agent_name, (False, [f"{VALIDATION_ERROR_PREFIX}{e}"])
+            continue
+        yield agent_name, (result.is_valid, list(result.warnings))
 
 
 def validate_all_agents() -> dict[str, Tuple[bool, List[str]]]:
     """
     Validate all configured agents
 
+    Collects iter_validate_all_agents into a dict.
+
     Returns:
         Dictionary mapping agent names to (is_valid, warnings) tuples
 
@@ -86,25 +238,25 @@ def validate_all_agents() -> dict[str, Tuple[bool, List[str]]]:
         >>> for agent_name, (is_valid, warnings) in results.items():
         ...     print(f"{agent_name}: {'OK' if is_valid else 'WARNINGS'}")
     """
-    config_manager = get_config_manager()
-    results = {}
+    # Returns an empty dict if agents cannot be listed rather than crashing
+    return dict(iter_validate_all_agents())
 
-    try:
-        agent_names = config_manager.loader.list_agents()
-        for agent_name in agent_names:
-            results[agent_name] = validate_agent_config(agent_name)
-    except Exception as e:
-        logger.error(f"Error listing agents: {e}")
-        # Return empty dict on error rather than crashing
-        return {}
 
-    return results
+def _format_agent_report(agent_name: str, is_valid: bool, warnings: List[str]) -> str:
+    """Render one agent's validation result as a block of report lines"""
+    status = "✅" if is_valid else "⚠️"
+    lines = [f"{status} {agent_name}"]
+    lines.extend(f"   - {warning}" for warning in warnings)
+    return "\n".join(lines) + "\n"
 
 
 def print_validation_report(agent_name: str = None) -> None:
     """
     Print a human-readable validation report
 
+    Each agent's block is written with a single write call as soon as that
+    agent is validated, and stdout is flushed once at the end.
+
     Args:
         agent_name: Specific agent to validate, or None for all agents
 
@@ -115,25 +267,16 @@ def print_validation_report(agent_name: str = None) -> None:
     """
     if agent_name:
         is_valid, warnings = validate_agent_config(agent_name)
-        status = "✅" if is_valid else "⚠️"
-        print(f"{status} {agent_name}")
-        if warnings:
-            for warning in warnings:
-                print(f"   - {warning}")
+        sys.stdout.write(_format_agent_report(agent_name, is_valid, warnings))
     else:
-        results = validate_all_agents()
-        for agent_name, (is_valid, warnings) in results.items():
-            status = "✅" if is_valid else "⚠️"
-            print(f"{status} {agent_name}")
-            if warnings:
-                for warning in warnings:
-                    print(f"   - {warning}")
+        # Write each agent as soon as it is validated
+        for agent_name, (is_valid, warnings) in iter_validate_all_agents():
+            sys.stdout.write(_format_agent_report(agent_name, is_valid, warnings))
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
     """CLI entry point for validation"""
-    import sys
-
     agent_name = sys.argv[1] if len(sys.argv) > 1 else None
     print_validation_report(agent_name)
 